@@ -0,0 +1,47 @@
+"""
+Custom authentication classes for the accounts app.
+"""
+from django.core.cache import cache
+from rest_framework import exceptions
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+
+# How long a resolved user may be served from cache before hitting the DB
+# again. Kept short so permission changes propagate quickly; explicit
+# invalidation on save/delete handles the common cases immediately.
+USER_CACHE_TTL = 60
+
+
+def user_cache_key(user_id):
+    """Cache key for an authenticated user lookup."""
+    return f'user:{user_id}'
+
+
+class CachingJWTAuthentication(JWTAuthentication):
+    """
+    JWT authentication that caches the request.user lookup.
+
+    Every authenticated request otherwise pays one SELECT on the users table
+    just to hydrate request.user from the validated token. Caching the user
+    object for a short TTL removes that round-trip on cache hits; the cache
+    entry is invalidated whenever the user row is saved or deleted.
+    """
+
+    def get_user(self, validated_token):
+        """Return the user for the token, from cache when possible."""
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError:
+            raise InvalidToken('Token contained no recognizable user identification')
+
+        cache_key = user_cache_key(user_id)
+        user = cache.get(cache_key)
+
+        if user is None:
+            user = super().get_user(validated_token)
+            cache.set(cache_key, user, USER_CACHE_TTL)
+        elif not user.is_active:
+            raise exceptions.AuthenticationFailed('User is inactive', code='user_inactive')
+
+        return user
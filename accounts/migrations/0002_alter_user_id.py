@@ -0,0 +1,19 @@
+# Generated by Django 4.2.9 on 2026-08-26 08:43
+
+from django.db import migrations, models
+import uuid6
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='user',
+            name='id',
+            field=models.UUIDField(default=uuid6.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+    ]
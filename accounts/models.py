@@ -1,7 +1,7 @@
 """
 User model with UUID primary key.
 """
-import uuid
+import uuid6
 from django.contrib.auth.models import AbstractUser
 from django.db import models
 
@@ -11,7 +11,7 @@ class User(AbstractUser):
     Custom User model with UUID primary key.
     Extends Django's AbstractUser to include all default fields.
     """
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid6.uuid7, editable=False)
     email = models.EmailField(unique=True)
     
     # Make username optional and use email for authentication
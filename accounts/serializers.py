@@ -2,9 +2,12 @@
 Serializers for user authentication.
 """
 from rest_framework import serializers
+from rest_framework_simplejwt.serializers import TokenRefreshSerializer
 from django.contrib.auth import get_user_model
 from django.contrib.auth.password_validation import validate_password
 
+from .tokens import CacheBlacklistRefreshToken
+
 User = get_user_model()
 
 
@@ -62,6 +65,16 @@ class UserSerializer(serializers.ModelSerializer):
         read_only_fields = ('id', 'date_joined')
 
 
+class CacheBlacklistTokenRefreshSerializer(TokenRefreshSerializer):
+    """
+    Token refresh serializer backed by the cache blacklist.
+
+    Rotated refresh tokens are revoked in the cache (O(1) per check)
+    instead of the token_blacklist database tables.
+    """
+    token_class = CacheBlacklistRefreshToken
+
+
 class LoginSerializer(serializers.Serializer):
     """
     Serializer for user login.
@@ -0,0 +1,42 @@
+"""
+JWT token classes with a cache-backed blacklist.
+"""
+from django.core.cache import cache
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import RefreshToken
+from rest_framework_simplejwt.utils import aware_utcnow, datetime_to_epoch
+
+
+def blacklist_cache_key(jti):
+    """Cache key marking a refresh token jti as revoked."""
+    return f'bl:{jti}'
+
+
+class CacheBlacklistRefreshToken(RefreshToken):
+    """
+    Refresh token whose blacklist lives in the cache instead of Postgres.
+
+    simplejwt's token_blacklist app stores revocations as rows, so every
+    refresh pays a lookup on a table that also needs periodic cleanup of
+    expired entries. Keying the cache on the token's jti with the token's
+    remaining lifetime as the TTL makes revocation checks a single O(1)
+    cache read and lets expired revocations clean themselves up.
+    """
+
+    def verify(self, *args, **kwargs):
+        self.check_blacklist()
+        super().verify(*args, **kwargs)
+
+    def check_blacklist(self):
+        """Raise TokenError if this token has been revoked."""
+        jti = self.payload[api_settings.JTI_CLAIM]
+        if cache.get(blacklist_cache_key(jti)) is not None:
+            raise TokenError('Token is blacklisted')
+
+    def blacklist(self):
+        """Revoke this token for the remainder of its lifetime."""
+        jti = self.payload[api_settings.JTI_CLAIM]
+        remaining = self.payload['exp'] - datetime_to_epoch(aware_utcnow())
+        if remaining > 0:
+            cache.set(blacklist_cache_key(jti), 1, timeout=remaining)
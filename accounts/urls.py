@@ -4,10 +4,17 @@ URL configuration for accounts app.
 from django.urls import path
 from rest_framework_simplejwt.views import TokenRefreshView
 
+from .serializers import CacheBlacklistTokenRefreshSerializer
 from .views import RegisterView, LoginView
 
 urlpatterns = [
     path('register/', RegisterView.as_view(), name='register'),
     path('login/', LoginView.as_view(), name='login'),
-    path('token/refresh/', TokenRefreshView.as_view(), name='token_refresh'),
+    path(
+        'token/refresh/',
+        TokenRefreshView.as_view(
+            serializer_class=CacheBlacklistTokenRefreshSerializer
+        ),
+        name='token_refresh'
+    ),
 ]
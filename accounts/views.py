@@ -3,19 +3,87 @@ Views for user authentication.
 """
 from rest_framework import status, generics, permissions
 from rest_framework.response import Response
-from rest_framework_simplejwt.tokens import RefreshToken
+from rest_framework_simplejwt.state import token_backend
+from rest_framework_simplejwt.tokens import Token
+from django.conf import settings
 from django.contrib.auth import authenticate, get_user_model
-from drf_yasg.utils import swagger_auto_schema
-from drf_yasg import openapi
 
 from .serializers import (
     UserRegistrationSerializer,
-    UserSerializer,
     LoginSerializer
 )
+from .tokens import CacheBlacklistRefreshToken
 
 User = get_user_model()
 
+# simplejwt resolves its TokenBackend lazily per Token instance via
+# import_string, re-reading the signing key settings on every token mint.
+# Bind the already-constructed module-level backend on the Token class once
+# at import so RefreshToken.for_user reuses it.
+Token._token_backend = token_backend
+
+# drf-yasg decorators construct openapi object graphs at import time that
+# live for the life of every worker. When docs are disabled the decorator
+# becomes a no-op and none of those objects are built.
+if settings.ENABLE_API_DOCS:
+    from drf_yasg.utils import swagger_auto_schema
+    from drf_yasg import openapi
+
+    _TOKENS_SCHEMA = openapi.Schema(
+        type=openapi.TYPE_OBJECT,
+        properties={
+            'access': openapi.Schema(type=openapi.TYPE_STRING),
+            'refresh': openapi.Schema(type=openapi.TYPE_STRING),
+        }
+    )
+    _AUTH_RESPONSE_SCHEMA = openapi.Schema(
+        type=openapi.TYPE_OBJECT,
+        properties={
+            'user': openapi.Schema(type=openapi.TYPE_OBJECT),
+            'tokens': _TOKENS_SCHEMA,
+            'message': openapi.Schema(type=openapi.TYPE_STRING),
+        }
+    )
+    _REGISTER_RESPONSE = openapi.Response(
+        description="User created successfully",
+        schema=_AUTH_RESPONSE_SCHEMA
+    )
+    _LOGIN_RESPONSE = openapi.Response(
+        description="Login successful",
+        schema=_AUTH_RESPONSE_SCHEMA
+    )
+else:
+    def swagger_auto_schema(**kwargs):
+        """No-op stand-in when API docs are disabled."""
+        return lambda view: view
+
+    _REGISTER_RESPONSE = "User created successfully"
+    _LOGIN_RESPONSE = "Login successful"
+
+
+def _user_payload(user):
+    """
+    Build the small user dict returned alongside tokens.
+
+    Constructing a UserSerializer per auth request re-runs DRF's field
+    binding just to render five attributes; a plain dict avoids that on
+    the hottest path after password hashing.
+    """
+    # DRF's DateTimeField renders UTC with a 'Z' suffix; keep that wire
+    # format instead of isoformat()'s '+00:00'.
+    date_joined = user.date_joined.isoformat()
+    if date_joined.endswith('+00:00'):
+        date_joined = date_joined[:-6] + 'Z'
+
+    return {
+        'id': str(user.id),
+        'username': user.username,
+        'email': user.email,
+        'first_name': user.first_name,
+        'last_name': user.last_name,
+        'date_joined': date_joined,
+    }
+
 
 class RegisterView(generics.CreateAPIView):
     """
@@ -30,23 +98,7 @@ class RegisterView(generics.CreateAPIView):
     @swagger_auto_schema(
         operation_description="Register a new user account",
         responses={
-            201: openapi.Response(
-                description="User created successfully",
-                schema=openapi.Schema(
-                    type=openapi.TYPE_OBJECT,
-                    properties={
-                        'user': openapi.Schema(type=openapi.TYPE_OBJECT),
-                        'tokens': openapi.Schema(
-                            type=openapi.TYPE_OBJECT,
-                            properties={
-                                'access': openapi.Schema(type=openapi.TYPE_STRING),
-                                'refresh': openapi.Schema(type=openapi.TYPE_STRING),
-                            }
-                        ),
-                        'message': openapi.Schema(type=openapi.TYPE_STRING),
-                    }
-                )
-            ),
+            201: _REGISTER_RESPONSE,
             400: "Bad Request - Validation errors"
         }
     )
@@ -56,10 +108,10 @@ class RegisterView(generics.CreateAPIView):
         user = serializer.save()
         
         # Generate JWT tokens
-        refresh = RefreshToken.for_user(user)
+        refresh = CacheBlacklistRefreshToken.for_user(user)
         
         return Response({
-            'user': UserSerializer(user).data,
+            'user': _user_payload(user),
             'tokens': {
                 'access': str(refresh.access_token),
                 'refresh': str(refresh),
@@ -80,23 +132,7 @@ class LoginView(generics.GenericAPIView):
     @swagger_auto_schema(
         operation_description="Login with username and password",
         responses={
-            200: openapi.Response(
-                description="Login successful",
-                schema=openapi.Schema(
-                    type=openapi.TYPE_OBJECT,
-                    properties={
-                        'user': openapi.Schema(type=openapi.TYPE_OBJECT),
-                        'tokens': openapi.Schema(
-                            type=openapi.TYPE_OBJECT,
-                            properties={
-                                'access': openapi.Schema(type=openapi.TYPE_STRING),
-                                'refresh': openapi.Schema(type=openapi.TYPE_STRING),
-                            }
-                        ),
-                        'message': openapi.Schema(type=openapi.TYPE_STRING),
-                    }
-                )
-            ),
+            200: _LOGIN_RESPONSE,
             401: "Unauthorized - Invalid credentials"
         }
     )
@@ -117,10 +153,10 @@ class LoginView(generics.GenericAPIView):
             }, status=status.HTTP_401_UNAUTHORIZED)
         
         # Generate JWT tokens
-        refresh = RefreshToken.for_user(user)
+        refresh = CacheBlacklistRefreshToken.for_user(user)
         
         return Response({
-            'user': UserSerializer(user).data,
+            'user': _user_payload(user),
             'tokens': {
                 'access': str(refresh.access_token),
                 'refresh': str(refresh),
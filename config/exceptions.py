@@ -13,21 +13,25 @@ def custom_exception_handler(exc, context):
     # Call REST framework's default exception handler first
     response = exception_handler(exc, context)
 
-    if response is not None:
-        # Customize the response data
-        custom_response_data = {
+    if response is None:
+        return None
+
+    # Build the payload in one pass. str(exc) walks DRF's ErrorDetail
+    # structures, so only pay for it when there is no 'detail' message.
+    data = response.data if isinstance(response.data, dict) else None
+
+    if data is not None and 'detail' in data:
+        response.data = {
+            'error': True,
+            'message': data['detail'],
+            'status_code': response.status_code,
+        }
+    else:
+        response.data = {
             'error': True,
             'message': str(exc),
             'status_code': response.status_code,
+            **({'errors': data} if data is not None else {}),
         }
-        
-        # Add field-specific errors if available
-        if isinstance(response.data, dict):
-            if 'detail' in response.data:
-                custom_response_data['message'] = response.data['detail']
-            else:
-                custom_response_data['errors'] = response.data
-        
-        response.data = custom_response_data
 
     return response
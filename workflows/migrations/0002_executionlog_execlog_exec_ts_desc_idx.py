@@ -0,0 +1,17 @@
+# Generated by Django 4.2.9 on 2026-08-26 08:42
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('workflows', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='executionlog',
+            index=models.Index(fields=['execution', '-timestamp'], name='execlog_exec_ts_desc_idx'),
+        ),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 4.2.9 on 2026-08-26 08:43
+
+from django.db import migrations, models
+import uuid6
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('workflows', '0002_executionlog_execlog_exec_ts_desc_idx'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='executionlog',
+            name='id',
+            field=models.UUIDField(default=uuid6.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='workflow',
+            name='id',
+            field=models.UUIDField(default=uuid6.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='workflowexecution',
+            name='id',
+            field=models.UUIDField(default=uuid6.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+    ]
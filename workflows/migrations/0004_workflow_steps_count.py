@@ -0,0 +1,45 @@
+# Generated by Django 4.2.9 on 2026-08-26 08:46
+
+from django.db import migrations, models
+
+
+def backfill_steps_count(apps, schema_editor):
+    """Populate the denormalized count for rows created before this field."""
+    Workflow = apps.get_model('workflows', 'Workflow')
+    for workflow in Workflow.objects.all().iterator():
+        Workflow.objects.filter(pk=workflow.pk).update(
+            steps_count=len(workflow.steps or [])
+        )
+
+
+def add_steps_gin_index(apps, schema_editor):
+    """Index the steps JSON for containment queries (PostgreSQL only)."""
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute(
+        'CREATE INDEX IF NOT EXISTS workflow_steps_gin '
+        'ON workflows USING gin (steps jsonb_path_ops)'
+    )
+
+
+def drop_steps_gin_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('DROP INDEX IF EXISTS workflow_steps_gin')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('workflows', '0003_alter_executionlog_id_alter_workflow_id_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='workflow',
+            name='steps_count',
+            field=models.PositiveIntegerField(default=0, help_text='Denormalized number of steps, kept in sync on save'),
+        ),
+        migrations.RunPython(backfill_steps_count, migrations.RunPython.noop),
+        migrations.RunPython(add_steps_gin_index, drop_steps_gin_index),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 4.2.9 on 2026-08-26 08:59
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('workflows', '0004_workflow_steps_count'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='executionlog',
+            name='execution_l_executi_e8afd0_idx',
+        ),
+        migrations.AddConstraint(
+            model_name='executionlog',
+            constraint=models.UniqueConstraint(fields=('execution', 'step_index'), name='uniq_exec_step'),
+        ),
+    ]
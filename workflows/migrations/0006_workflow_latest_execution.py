@@ -0,0 +1,30 @@
+# Generated by Django 4.2.9 on 2026-08-26 09:13
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+def backfill_latest_execution(apps, schema_editor):
+    """Point existing workflows at their most recent execution."""
+    Workflow = apps.get_model('workflows', 'Workflow')
+    WorkflowExecution = apps.get_model('workflows', 'WorkflowExecution')
+    latest = WorkflowExecution.objects.filter(
+        workflow=models.OuterRef('pk')
+    ).order_by('-created_at').values('id')[:1]
+    Workflow.objects.update(latest_execution_id=models.Subquery(latest))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('workflows', '0005_remove_executionlog_execution_l_executi_e8afd0_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='workflow',
+            name='latest_execution',
+            field=models.ForeignKey(blank=True, help_text='Denormalized pointer to the most recent execution', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='workflows.workflowexecution'),
+        ),
+        migrations.RunPython(backfill_latest_execution, migrations.RunPython.noop),
+    ]
@@ -1,7 +1,7 @@
 """
 Database models for workflows.
 """
-import uuid
+import uuid6
 from django.db import models
 from django.conf import settings
 
@@ -14,7 +14,7 @@ class Workflow(models.Model):
     Each step has a type (e.g., data_fetch, data_process, ai_inference, notify_user)
     and configuration parameters.
     """
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid6.uuid7, editable=False)
     user = models.ForeignKey(
         settings.AUTH_USER_MODEL,
         on_delete=models.CASCADE,
@@ -25,16 +25,33 @@ class Workflow(models.Model):
     steps = models.JSONField(
         help_text="List of workflow steps with type and configuration"
     )
+    steps_count = models.PositiveIntegerField(
+        default=0,
+        help_text="Denormalized number of steps, kept in sync on save"
+    )
+    latest_execution = models.ForeignKey(
+        'WorkflowExecution',
+        null=True,
+        blank=True,
+        on_delete=models.SET_NULL,
+        related_name='+',
+        help_text="Denormalized pointer to the most recent execution"
+    )
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
-    
+
     class Meta:
         db_table = 'workflows'
         ordering = ['-created_at']
         indexes = [
             models.Index(fields=['user', '-created_at']),
         ]
-    
+
+    def save(self, *args, **kwargs):
+        """Keep the denormalized step count in sync with the steps JSON."""
+        self.steps_count = len(self.steps or [])
+        super().save(*args, **kwargs)
+
     def __str__(self):
         return f"{self.name} - {self.user.username}"
 
@@ -52,7 +69,7 @@ class WorkflowExecution(models.Model):
         SUCCESS = 'SUCCESS', 'Success'
         FAILED = 'FAILED', 'Failed'
     
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid6.uuid7, editable=False)
     workflow = models.ForeignKey(
         Workflow,
         on_delete=models.CASCADE,
@@ -85,10 +102,36 @@ class WorkflowExecution(models.Model):
         return f"{self.workflow.name} - {self.status} - {self.id}"
 
 
+class ExecutionLogManager(models.Manager):
+    """
+    Manager with batched write helpers for execution logs.
+    """
+
+    def bulk_log(self, rows, batch_size=500):
+        """
+        Persist a buffer of log rows in batched INSERTs.
+
+        Accepts an iterable of field dicts (as passed to create()) and
+        flushes them with bulk_create, turning N single-row round-trips
+        into ceil(N / batch_size) statements. Rows carry their final
+        status/duration, so no follow-up UPDATE pass is needed either.
+
+        Writes upsert on (execution, step_index): a retry that re-runs a
+        step overwrites that step's earlier row instead of duplicating it.
+        """
+        return self.bulk_create(
+            [ExecutionLog(**row) for row in rows],
+            batch_size=batch_size,
+            update_conflicts=True,
+            unique_fields=['execution', 'step_index'],
+            update_fields=['step_name', 'status', 'message', 'duration_seconds']
+        )
+
+
 class ExecutionLog(models.Model):
     """
     ExecutionLog model for step-level logging during workflow execution.
-    
+
     Records detailed information about each step's execution including
     status, timing, and any messages or errors.
     """
@@ -100,7 +143,7 @@ class ExecutionLog(models.Model):
         FAILED = 'FAILED', 'Failed'
         SKIPPED = 'SKIPPED', 'Skipped'
     
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid6.uuid7, editable=False)
     execution = models.ForeignKey(
         WorkflowExecution,
         on_delete=models.CASCADE,
@@ -116,13 +159,29 @@ class ExecutionLog(models.Model):
     message = models.TextField(blank=True)
     timestamp = models.DateTimeField(auto_now_add=True)
     duration_seconds = models.FloatField(null=True, blank=True)
-    
+
+    objects = ExecutionLogManager()
+
     class Meta:
         db_table = 'execution_logs'
         ordering = ['execution', 'step_index', 'timestamp']
+        constraints = [
+            # One log row per step per execution; retries upsert into it.
+            # Its backing index also serves the per-step "already
+            # succeeded?" lookup used by canvas-dispatched retries.
+            models.UniqueConstraint(
+                fields=['execution', 'step_index'],
+                name='uniq_exec_step'
+            ),
+        ]
         indexes = [
-            models.Index(fields=['execution', 'step_index']),
             models.Index(fields=['status']),
+            # Log tailing orders by timestamp DESC per execution; a matching
+            # index turns that into a backward index scan instead of a sort.
+            models.Index(
+                fields=['execution', '-timestamp'],
+                name='execlog_exec_ts_desc_idx'
+            ),
         ]
     
     def __str__(self):
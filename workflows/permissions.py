@@ -12,16 +12,22 @@ class IsWorkflowOwner(permissions.BasePermission):
     def has_object_permission(self, request, view, obj):
         """
         Check if the user owns the workflow.
-        
-        For Workflow objects, check the user field directly.
-        For WorkflowExecution objects, check the workflow's user field.
+
+        For Workflow objects, check the user FK directly.
+        For WorkflowExecution objects, check the workflow's user FK.
+
+        Comparisons use the *_id columns already present on the fetched
+        row, so the check never dereferences a lazy relation and issues
+        no extra queries.
         """
         # Handle Workflow objects
-        if hasattr(obj, 'user'):
-            return obj.user == request.user
-        
+        user_id = getattr(obj, 'user_id', None)
+        if user_id is not None:
+            return user_id == request.user.id
+
         # Handle WorkflowExecution objects
-        if hasattr(obj, 'workflow'):
-            return obj.workflow.user == request.user
-        
+        workflow = getattr(obj, 'workflow', None)
+        if workflow is not None:
+            return workflow.user_id == request.user.id
+
         return False
@@ -1,9 +1,74 @@
 """
 Serializers for workflow models.
 """
+import fastjsonschema
+
 from rest_framework import serializers
 from .models import Workflow, WorkflowExecution, ExecutionLog
 
+# The supported step types, shared by the schema below and anything that
+# needs an O(1) membership check. Frozen so it is built exactly once.
+VALID_STEP_TYPES = frozenset((
+    'data_fetch',
+    'data_process',
+    'ai_inference',
+    'notify_user',
+))
+
+# Compiled once at import: fastjsonschema generates a specialized validator
+# function, so validating an N-step workflow is a single straight-line call
+# instead of N interpreter-bound isinstance/membership checks.
+_STEP_LIST_VALIDATOR = fastjsonschema.compile({
+    'type': 'array',
+    'minItems': 1,
+    'items': {
+        'type': 'object',
+        'required': ['type', 'name'],
+        'properties': {
+            'type': {'enum': sorted(VALID_STEP_TYPES)},
+            'name': {'type': 'string'},
+            'config': {'type': 'object'},
+        },
+    },
+})
+
+
+def _render_datetime(value):
+    """Format a datetime the way DRF's DateTimeField does (UTC 'Z' suffix)."""
+    if value is None:
+        return None
+    formatted = value.isoformat()
+    if formatted.endswith('+00:00'):
+        formatted = formatted[:-6] + 'Z'
+    return formatted
+
+
+class ExecutionLogListSerializer(serializers.ListSerializer):
+    """
+    List serializer that renders log rows as plain dicts.
+
+    Executions can carry hundreds of log lines; going through DRF's
+    per-instance, per-field to_representation machinery for each one is
+    the dominant Python cost of the detail endpoint. Building the dicts
+    directly keeps the output identical while skipping field binding and
+    get_attribute resolution per row.
+    """
+
+    def to_representation(self, data):
+        logs = data.all() if hasattr(data, 'all') else data
+        return [
+            {
+                'id': str(log.id),
+                'step_name': log.step_name,
+                'step_index': log.step_index,
+                'status': log.status,
+                'message': log.message,
+                'timestamp': _render_datetime(log.timestamp),
+                'duration_seconds': log.duration_seconds,
+            }
+            for log in logs
+        ]
+
 
 class ExecutionLogSerializer(serializers.ModelSerializer):
     """
@@ -11,6 +76,7 @@ class ExecutionLogSerializer(serializers.ModelSerializer):
     """
     class Meta:
         model = ExecutionLog
+        list_serializer_class = ExecutionLogListSerializer
         fields = (
             'id',
             'step_name',
@@ -83,7 +149,7 @@ class WorkflowSerializer(serializers.ModelSerializer):
     Serializer for Workflow model.
     """
     user = serializers.HiddenField(default=serializers.CurrentUserDefault())
-    executions_count = serializers.SerializerMethodField()
+    executions_count = serializers.IntegerField(read_only=True, default=0)
     
     class Meta:
         model = Workflow
@@ -98,56 +164,21 @@ class WorkflowSerializer(serializers.ModelSerializer):
             'executions_count'
         )
         read_only_fields = ('id', 'created_at', 'updated_at')
-    
-    def get_executions_count(self, obj):
-        """Get the total number of executions for this workflow."""
-        return obj.executions.count()
-    
+
     def validate_steps(self, value):
         """
         Validate that steps is a list of valid step configurations.
-        
+
         Each step must have:
         - type: one of [data_fetch, data_process, ai_inference, notify_user]
         - name: descriptive name for the step
         - config: optional configuration dictionary
         """
-        if not isinstance(value, list):
-            raise serializers.ValidationError("Steps must be a list")
-        
-        if len(value) == 0:
-            raise serializers.ValidationError("Workflow must have at least one step")
-        
-        valid_step_types = ['data_fetch', 'data_process', 'ai_inference', 'notify_user']
-        
-        for idx, step in enumerate(value):
-            if not isinstance(step, dict):
-                raise serializers.ValidationError(
-                    f"Step {idx} must be a dictionary"
-                )
-            
-            if 'type' not in step:
-                raise serializers.ValidationError(
-                    f"Step {idx} must have a 'type' field"
-                )
-            
-            if step['type'] not in valid_step_types:
-                raise serializers.ValidationError(
-                    f"Step {idx} has invalid type '{step['type']}'. "
-                    f"Must be one of: {', '.join(valid_step_types)}"
-                )
-            
-            if 'name' not in step:
-                raise serializers.ValidationError(
-                    f"Step {idx} must have a 'name' field"
-                )
-            
-            # Config is optional
-            if 'config' in step and not isinstance(step['config'], dict):
-                raise serializers.ValidationError(
-                    f"Step {idx} config must be a dictionary"
-                )
-        
+        try:
+            _STEP_LIST_VALIDATOR(value)
+        except fastjsonschema.JsonSchemaException as exc:
+            raise serializers.ValidationError(exc.message)
+
         return value
 
 
@@ -155,9 +186,11 @@ class WorkflowListSerializer(serializers.ModelSerializer):
     """
     Lightweight serializer for listing workflows.
     """
-    executions_count = serializers.SerializerMethodField()
-    steps_count = serializers.SerializerMethodField()
-    
+    executions_count = serializers.IntegerField(read_only=True, default=0)
+    success_count = serializers.IntegerField(read_only=True, default=0)
+    failed_count = serializers.IntegerField(read_only=True, default=0)
+    running_count = serializers.IntegerField(read_only=True, default=0)
+
     class Meta:
         model = Workflow
         fields = (
@@ -166,15 +199,10 @@ class WorkflowListSerializer(serializers.ModelSerializer):
             'description',
             'steps_count',
             'executions_count',
+            'success_count',
+            'failed_count',
+            'running_count',
             'created_at',
             'updated_at'
         )
         read_only_fields = fields
-    
-    def get_executions_count(self, obj):
-        """Get the total number of executions for this workflow."""
-        return obj.executions.count()
-    
-    def get_steps_count(self, obj):
-        """Get the number of steps in the workflow."""
-        return len(obj.steps) if obj.steps else 0
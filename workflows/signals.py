@@ -0,0 +1,25 @@
+"""
+Signal handlers for the workflows app.
+"""
+from django.db.models import Q
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+
+from .models import Workflow, WorkflowExecution
+
+
+@receiver(post_save, sender=WorkflowExecution)
+def track_latest_execution(sender, instance, created, **kwargs):
+    """
+    Keep Workflow.latest_execution pointing at the newest execution.
+
+    Runs only on creation — later status changes mutate the same row, so
+    the pointer stays valid. The created_at guard makes the update a
+    no-op if a newer execution was inserted concurrently.
+    """
+    if not created:
+        return
+    Workflow.objects.filter(pk=instance.workflow_id).filter(
+        Q(latest_execution__isnull=True)
+        | Q(latest_execution__created_at__lte=instance.created_at)
+    ).update(latest_execution=instance)
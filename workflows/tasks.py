@@ -8,142 +8,258 @@ This module implements the core workflow execution logic with:
 - Persistent state updates
 - Comprehensive error handling and logging
 """
+import hashlib
+import json
 import time
 import logging
-from datetime import datetime
-from celery import shared_task
+from celery import chain, group, shared_task
+from django.conf import settings
+from django.core.cache import cache
 from django.utils import timezone
-from django.db import transaction
+from django.db import DatabaseError, transaction
+from django.db.models.functions import Greatest
 
-from .models import Workflow, WorkflowExecution, ExecutionLog
+from .models import WorkflowExecution, ExecutionLog
 
 logger = logging.getLogger(__name__)
 
+# How many buffered step logs to accumulate before flushing a batch
+LOG_FLUSH_BATCH = 100
 
-@shared_task(bind=True, max_retries=3, default_retry_delay=60)
+# Persist current_step every this many steps. Progress is only needed to
+# resume after a failure, so checkpointing trades exact per-step progress
+# rows for far fewer fsync-bound UPDATEs on long workflows.
+CHECKPOINT_INTERVAL = 5
+
+# How long a cached step result stays valid
+STEP_CACHE_TTL = 3600
+
+
+def status_cache_key(workflow_id):
+    """Cache key for a workflow's latest-execution status payload."""
+    return f'wfexec:{workflow_id}:latest'
+
+
+@shared_task(
+    bind=True,
+    max_retries=3,
+    autoretry_for=(Exception,),
+    retry_backoff=60,
+    retry_backoff_max=7200,
+    retry_jitter=True,
+    acks_late=True,
+    task_reject_on_worker_lost=True,
+    ignore_result=True,
+)
 def execute_workflow_task(self, execution_id):
     """
     Main Celery task for executing a workflow.
-    
+
     This task orchestrates the execution of all steps in a workflow,
-    handling retries, state persistence, and error recovery.
-    
+    handling retries, state persistence, and error recovery. Retries are
+    declarative: any exception reaching Celery is rescheduled with
+    exponential backoff and jitter, and the execution row is only marked
+    FAILED once retries are exhausted.
+
     Args:
         execution_id: UUID of the WorkflowExecution to execute
-    
+
     Returns:
         dict: Execution result with status and message
     """
+    # UUID-to-string formatting isn't free; do it once and reuse the
+    # result in every return dict and dispatch signature below.
+    eid_str = str(execution_id)
+
     try:
-        # Fetch the execution object
-        execution = WorkflowExecution.objects.select_related('workflow').get(id=execution_id)
-        workflow = execution.workflow
-        
-        logger.info(f"Starting workflow execution: {execution_id}")
-        
-        # Check if already completed (idempotency)
-        if execution.status in [WorkflowExecution.Status.SUCCESS, WorkflowExecution.Status.FAILED]:
-            logger.warning(f"Execution {execution_id} already completed with status {execution.status}")
+        # Idempotency precheck: re-invocations of finished executions only
+        # need the status column, so answer them from a single-column query
+        # before paying for the workflow join and model construction.
+        current_status = WorkflowExecution.objects.filter(
+            id=execution_id
+        ).values_list('status', flat=True).first()
+
+        if current_status is None:
+            raise WorkflowExecution.DoesNotExist
+
+        if current_status in [WorkflowExecution.Status.SUCCESS, WorkflowExecution.Status.FAILED]:
+            logger.warning(f"Execution {execution_id} already completed with status {current_status}")
             return {
-                'status': execution.status,
+                'status': current_status,
                 'message': 'Execution already completed',
-                'execution_id': str(execution_id)
+                'execution_id': eid_str
             }
-        
+
+        # Fetch the execution object, trimming the SELECT to the columns the
+        # runner actually reads; everything else stays deferred.
+        execution = WorkflowExecution.objects.select_related('workflow').only(
+            'id', 'status', 'current_step', 'started_at', 'task_id',
+            'workflow__id', 'workflow__steps'
+        ).get(id=execution_id)
+        workflow = execution.workflow
+
+        logger.info(f"Starting workflow execution: {execution_id}")
+
         # Update status to RUNNING if not already
         if execution.status == WorkflowExecution.Status.CREATED:
             execution.status = WorkflowExecution.Status.RUNNING
             execution.started_at = timezone.now()
             execution.task_id = self.request.id
             execution.save(update_fields=['status', 'started_at', 'task_id'])
+            cache.delete(status_cache_key(workflow.id))
         
-        # Execute each step sequentially
         steps = workflow.steps
         total_steps = len(steps)
-        
-        for step_index, step in enumerate(steps):
+
+        # Steps that declare dependencies form a DAG; dispatch them as a
+        # Celery canvas (a chain of groups) so independent steps in each
+        # wave run concurrently across workers instead of serializing
+        # IO-bound work in this loop.
+        if any('depends_on' in step for step in steps):
+            waves = _plan_waves(steps)
+            flow = chain(*(
+                [group(execute_single_step.si(eid_str, index)
+                       for index in wave)
+                 for wave in waves]
+                + [finalize_workflow_execution.si(eid_str)]
+            ))
+            flow.apply_async()
+            logger.info(
+                f"Dispatched execution {execution_id} as a canvas of "
+                f"{len(waves)} waves"
+            )
+            return {
+                'status': 'DISPATCHED',
+                'message': f'Workflow dispatched as {len(waves)} parallel waves',
+                'execution_id': eid_str,
+                'total_steps': total_steps
+            }
+
+        # Pull each step's fields out of the JSON dicts once up front;
+        # the loop (and any retry re-entering it) then iterates plain
+        # tuples instead of re-hashing dict keys per step.
+        parsed_steps = [
+            (step.get('name', f"Step {index}"),
+             step.get('type'),
+             step.get('config') or {})
+            for index, step in enumerate(steps)
+        ]
+
+        # Execute each step sequentially. Finished step logs are buffered
+        # and flushed through bulk_log so a long workflow issues batched
+        # INSERTs instead of a create + update round-trip per step.
+        pending_logs = []
+
+        for step_index, (step_name, step_type, step_config) in enumerate(parsed_steps):
             # Skip already completed steps (for retry scenarios)
             if step_index < execution.current_step:
-                logger.info(f"Skipping already completed step {step_index}: {step.get('name')}")
+                logger.info(f"Skipping already completed step {step_index}: {step_name}")
                 continue
-            
-            step_name = step.get('name', f"Step {step_index}")
-            step_type = step.get('type')
-            step_config = step.get('config', {})
-            
+
             logger.info(f"Executing step {step_index + 1}/{total_steps}: {step_name} ({step_type})")
-            
-            # Create execution log for this step
-            log_entry = ExecutionLog.objects.create(
-                execution=execution,
-                step_name=step_name,
-                step_index=step_index,
-                status=ExecutionLog.Status.RUNNING,
-                message=f"Starting {step_type} step"
-            )
-            
+
             step_start_time = time.time()
-            
+
             try:
                 # Execute the step based on its type
-                step_result = execute_step(step_type, step_config, step_name)
-                
+                step_result = execute_step(
+                    step_type, step_config, step_name,
+                    workflow_id=workflow.id, step_index=step_index
+                )
+
                 step_duration = time.time() - step_start_time
-                
-                # Update log entry with success
-                log_entry.status = ExecutionLog.Status.SUCCESS
-                log_entry.message = step_result.get('message', 'Step completed successfully')
-                log_entry.duration_seconds = step_duration
-                log_entry.save()
-                
-                # Update execution progress
+
+                # Buffer the completed step's log entry
+                pending_logs.append({
+                    'execution': execution,
+                    'step_name': step_name,
+                    'step_index': step_index,
+                    'status': ExecutionLog.Status.SUCCESS,
+                    'message': step_result.get('message', 'Step completed successfully'),
+                    'duration_seconds': step_duration,
+                })
+                # Commit this step's log flush and progress checkpoint as a
+                # single unit — one fsync instead of one per statement
                 execution.current_step = step_index + 1
-                execution.save(update_fields=['current_step'])
-                
+                checkpoint_due = (
+                    execution.current_step % CHECKPOINT_INTERVAL == 0
+                    or step_index == total_steps - 1
+                )
+                with transaction.atomic():
+                    # A persisted checkpoint lets a redelivery skip these
+                    # steps without re-running them, so their logs must be
+                    # durable first: flush whenever the batch fills or a
+                    # checkpoint is written, never letting saved progress
+                    # outrun saved logs.
+                    if pending_logs and (
+                        checkpoint_due or len(pending_logs) >= LOG_FLUSH_BATCH
+                    ):
+                        ExecutionLog.objects.bulk_log(pending_logs)
+                        pending_logs = []
+                    if checkpoint_due:
+                        execution.save(update_fields=['current_step'])
+
                 logger.info(f"Step {step_index} completed in {step_duration:.2f}s")
-                
+
             except Exception as step_error:
                 step_duration = time.time() - step_start_time
-                
-                # Update log entry with failure
-                log_entry.status = ExecutionLog.Status.FAILED
-                log_entry.message = f"Step failed: {str(step_error)}"
-                log_entry.duration_seconds = step_duration
-                log_entry.save()
-                
+
+                # Flush buffered logs together with this step's failure entry
+                pending_logs.append({
+                    'execution': execution,
+                    'step_name': step_name,
+                    'step_index': step_index,
+                    'status': ExecutionLog.Status.FAILED,
+                    'message': f"Step failed: {str(step_error)}",
+                    'duration_seconds': step_duration,
+                })
                 logger.error(f"Step {step_index} failed: {str(step_error)}")
-                
-                # Mark execution as failed
-                execution.status = WorkflowExecution.Status.FAILED
-                execution.finished_at = timezone.now()
-                execution.error_message = f"Failed at step {step_index} ({step_name}): {str(step_error)}"
-                execution.save(update_fields=['status', 'finished_at', 'error_message'])
-                
-                # Retry the entire workflow with exponential backoff
-                retry_count = self.request.retries
-                if retry_count < self.max_retries:
-                    retry_delay = 60 * (2 ** retry_count)  # Exponential backoff: 60s, 120s, 240s
-                    logger.info(f"Retrying workflow in {retry_delay}s (attempt {retry_count + 1}/{self.max_retries})")
-                    raise self.retry(exc=step_error, countdown=retry_delay)
-                else:
+
+                if self.request.retries >= self.max_retries:
+                    # Out of retries: record the terminal failure and the
+                    # buffered logs in one commit
+                    execution.status = WorkflowExecution.Status.FAILED
+                    execution.finished_at = timezone.now()
+                    execution.error_message = f"Failed at step {step_index} ({step_name}): {str(step_error)}"
+                    with transaction.atomic():
+                        ExecutionLog.objects.bulk_log(pending_logs)
+                        execution.save(update_fields=['status', 'current_step', 'finished_at', 'error_message'])
+                    pending_logs = []
+                    cache.delete(status_cache_key(workflow.id))
                     logger.error(f"Max retries reached for execution {execution_id}")
                     return {
                         'status': 'FAILED',
                         'message': execution.error_message,
-                        'execution_id': str(execution_id)
+                        'execution_id': eid_str
                     }
+
+                # Persist the logs and resume checkpoint together, then
+                # re-raise (outside the transaction) so Celery's autoretry
+                # reschedules with exponential backoff and jitter. The
+                # execution stays RUNNING — a transient failure no longer
+                # leaves a misleading FAILED row between attempts.
+                with transaction.atomic():
+                    ExecutionLog.objects.bulk_log(pending_logs)
+                    execution.save(update_fields=['current_step'])
+                pending_logs = []
+                raise
         
-        # All steps completed successfully
+        # All steps completed successfully; final logs and the terminal
+        # state transition commit together
         execution.status = WorkflowExecution.Status.SUCCESS
         execution.finished_at = timezone.now()
-        execution.save(update_fields=['status', 'finished_at'])
-        
+        with transaction.atomic():
+            if pending_logs:
+                ExecutionLog.objects.bulk_log(pending_logs)
+            execution.save(update_fields=['status', 'finished_at'])
+        cache.delete(status_cache_key(workflow.id))
+
         logger.info(f"Workflow execution {execution_id} completed successfully")
         
         return {
             'status': 'SUCCESS',
             'message': 'Workflow completed successfully',
-            'execution_id': str(execution_id),
+            'execution_id': eid_str,
             'total_steps': total_steps
         }
         
@@ -152,50 +268,281 @@ def execute_workflow_task(self, execution_id):
         return {
             'status': 'ERROR',
             'message': 'Execution not found',
-            'execution_id': str(execution_id)
+            'execution_id': eid_str
         }
     except Exception as e:
         logger.exception(f"Unexpected error in workflow execution {execution_id}")
-        
-        # Try to update execution status
-        try:
-            execution = WorkflowExecution.objects.get(id=execution_id)
-            execution.status = WorkflowExecution.Status.FAILED
-            execution.finished_at = timezone.now()
-            execution.error_message = f"Unexpected error: {str(e)}"
-            execution.save(update_fields=['status', 'finished_at', 'error_message'])
-        except:
-            pass
-        
+
+        # Record the terminal failure only once retries are exhausted;
+        # earlier attempts re-raise and let autoretry reschedule.
+        if self.request.retries >= self.max_retries:
+            try:
+                execution = WorkflowExecution.objects.get(id=execution_id)
+                execution.status = WorkflowExecution.Status.FAILED
+                execution.finished_at = timezone.now()
+                execution.error_message = f"Unexpected error: {str(e)}"
+                execution.save(update_fields=['status', 'finished_at', 'error_message'])
+                cache.delete(status_cache_key(execution.workflow_id))
+            except WorkflowExecution.DoesNotExist:
+                logger.error(f"WorkflowExecution {execution_id} vanished before FAILED state could be recorded")
+            except DatabaseError:
+                # Surface the persistence failure instead of swallowing it;
+                # the original error still propagates below.
+                logger.exception(f"Failed to persist FAILED state for {execution_id}")
+
         raise
 
 
-def execute_step(step_type, config, step_name):
+def _plan_waves(steps):
+    """
+    Group step indices into dependency waves for canvas dispatch.
+
+    Each wave holds the steps whose depends_on entries are all satisfied
+    by earlier waves; steps without depends_on join the first possible
+    wave. Raises ValueError for cycles or references to unknown steps.
+    """
+    remaining = set(range(len(steps)))
+    resolved = set()
+    waves = []
+
+    while remaining:
+        wave = [
+            index for index in sorted(remaining)
+            if set(steps[index].get('depends_on', [])) <= resolved
+        ]
+        if not wave:
+            raise ValueError(
+                "Workflow steps contain a dependency cycle or an invalid "
+                "depends_on reference"
+            )
+        waves.append(wave)
+        resolved.update(wave)
+        remaining.difference_update(wave)
+
+    return waves
+
+
+@shared_task(ignore_result=True, acks_late=False)
+def record_log(execution_id, step_index, step_name, status, message, duration_seconds):
+    """
+    Fire-and-forget persistence of a single step's log row.
+
+    Upserts on (execution, step_index) like the inline writes, so a
+    duplicated delivery or retried step never creates extra rows.
+    ignore_result keeps Redis free of result payloads for log traffic.
+    """
+    ExecutionLog.objects.update_or_create(
+        execution_id=execution_id,
+        step_index=step_index,
+        defaults={
+            'step_name': step_name,
+            'status': status,
+            'message': message,
+            'duration_seconds': duration_seconds,
+        }
+    )
+
+
+def _record_step_log(execution_id, step_index, step_name, status, message, duration_seconds):
+    """
+    Persist a canvas step's log row, async when WORKFLOW_ASYNC_LOGS is on.
+
+    With the flag enabled the write happens in a record_log task so the
+    step worker moves on without waiting for the database; otherwise it
+    is a synchronous upsert (tests and eager setups without a broker).
+    """
+    if settings.WORKFLOW_ASYNC_LOGS:
+        record_log.delay(
+            str(execution_id), step_index, step_name,
+            status, message, duration_seconds
+        )
+    else:
+        record_log(
+            execution_id, step_index, step_name,
+            status, message, duration_seconds
+        )
+
+
+@shared_task(
+    bind=True,
+    max_retries=3,
+    autoretry_for=(Exception,),
+    retry_backoff=60,
+    retry_backoff_max=7200,
+    retry_jitter=True,
+    acks_late=True,
+    task_reject_on_worker_lost=True,
+    ignore_result=True,
+)
+def execute_single_step(self, execution_id, step_index):
+    """
+    Run one workflow step as part of a canvas-dispatched wave.
+
+    Persists the step's log entry and advances current_step; already
+    successful steps are skipped so wave retries stay idempotent.
+    """
+    execution = WorkflowExecution.objects.select_related('workflow').only(
+        'id', 'status', 'current_step', 'workflow__id', 'workflow__steps'
+    ).get(id=execution_id)
+
+    if ExecutionLog.objects.filter(
+        execution=execution,
+        step_index=step_index,
+        status=ExecutionLog.Status.SUCCESS
+    ).exists():
+        logger.info(f"Skipping already completed step {step_index} of {execution_id}")
+        return {'status': 'SKIPPED', 'step_index': step_index}
+
+    step = execution.workflow.steps[step_index]
+    step_name = step.get('name', f"Step {step_index}")
+    step_type = step.get('type')
+    step_config = step.get('config', {})
+
+    step_start_time = time.time()
+
+    try:
+        step_result = execute_step(
+            step_type, step_config, step_name,
+            workflow_id=execution.workflow_id, step_index=step_index
+        )
+        step_duration = time.time() - step_start_time
+
+        # The upsert on (execution, step_index) means a retried step
+        # replaces its FAILED row rather than duplicating it
+        _record_step_log(
+            execution_id, step_index, step_name,
+            ExecutionLog.Status.SUCCESS,
+            step_result.get('message', 'Step completed successfully'),
+            step_duration
+        )
+        # Waves complete out of order, so only ever move progress forward
+        WorkflowExecution.objects.filter(id=execution_id).update(
+            current_step=Greatest('current_step', step_index + 1)
+        )
+
+        logger.info(f"Step {step_index} completed in {step_duration:.2f}s")
+        return {'status': 'SUCCESS', 'step_index': step_index}
+
+    except Exception as step_error:
+        step_duration = time.time() - step_start_time
+        _record_step_log(
+            execution_id, step_index, step_name,
+            ExecutionLog.Status.FAILED,
+            f"Step failed: {str(step_error)}",
+            step_duration
+        )
+        logger.error(f"Step {step_index} failed: {str(step_error)}")
+
+        if self.request.retries >= self.max_retries:
+            WorkflowExecution.objects.filter(id=execution_id).update(
+                status=WorkflowExecution.Status.FAILED,
+                finished_at=timezone.now(),
+                error_message=f"Failed at step {step_index} ({step_name}): {str(step_error)}"
+            )
+            cache.delete(status_cache_key(execution.workflow_id))
+        raise
+
+
+@shared_task(ignore_result=True)
+def finalize_workflow_execution(execution_id):
+    """
+    Chord/chain callback marking a canvas-dispatched execution finished.
+    """
+    updated = WorkflowExecution.objects.filter(
+        id=execution_id,
+        status=WorkflowExecution.Status.RUNNING
+    ).update(
+        status=WorkflowExecution.Status.SUCCESS,
+        finished_at=timezone.now()
+    )
+    if updated:
+        workflow_id = WorkflowExecution.objects.filter(
+            id=execution_id
+        ).values_list('workflow_id', flat=True).first()
+        cache.delete(status_cache_key(workflow_id))
+        logger.info(f"Workflow execution {execution_id} completed successfully")
+
+
+class StepRegistry:
+    """
+    Registry mapping step type names to their handler functions.
+
+    Handlers self-register with the @StepRegistry.register decorator, so
+    adding a step type is a single decorated function — execute_step and
+    the task runners never need to change.
+    """
+
+    _handlers = {}
+
+    @classmethod
+    def register(cls, step_type, cacheable=True):
+        """
+        Decorator registering a handler under the given step type.
+
+        Handlers with side effects (notifications, webhooks) register
+        with cacheable=False so their results are never served from
+        cache regardless of per-step config.
+        """
+        def decorator(handler):
+            handler.cacheable = cacheable
+            cls._handlers[step_type] = handler
+            return handler
+        return decorator
+
+    @classmethod
+    def get(cls, step_type):
+        """Return the handler for a step type, or None if unregistered."""
+        return cls._handlers.get(step_type)
+
+
+def execute_step(step_type, config, step_name, workflow_id=None, step_index=None):
     """
     Execute a single workflow step based on its type.
-    
+
     Args:
         step_type: Type of step (data_fetch, data_process, ai_inference, notify_user)
         config: Configuration dictionary for the step
         step_name: Name of the step for logging
-    
+        workflow_id: Owning workflow's UUID, used to scope the result cache
+        step_index: Position of the step within the workflow
+
     Returns:
         dict: Step execution result
     """
-    step_handlers = {
-        'data_fetch': execute_data_fetch,
-        'data_process': execute_data_process,
-        'ai_inference': execute_ai_inference,
-        'notify_user': execute_notify_user,
-    }
-    
-    handler = step_handlers.get(step_type)
+    handler = StepRegistry.get(step_type)
     if not handler:
         raise ValueError(f"Unknown step type: {step_type}")
-    
-    return handler(config, step_name)
 
+    # Deterministic configs produce deterministic results, so a retry
+    # that re-runs from step 0 skips recomputing steps that already
+    # succeeded. The key is scoped to (workflow, step position) so
+    # results never leak between workflows — or tenants — that happen to
+    # share a config. Side-effecting handlers (registered with
+    # cacheable=False) and steps with no_cache always run; so do direct
+    # calls that don't identify their workflow.
+    if (config.get('no_cache')
+            or not getattr(handler, 'cacheable', True)
+            or workflow_id is None
+            or step_index is None):
+        return handler(config, step_name)
+
+    config_hash = hashlib.sha1(
+        json.dumps(config, sort_keys=True).encode()
+    ).hexdigest()
+    cache_key = f"wfstep:{workflow_id}:{step_index}:{config_hash}"
+
+    result = cache.get(cache_key)
+    if result is not None:
+        logger.info(f"[{step_name}] Serving cached result for {step_type}")
+        return result
 
+    result = handler(config, step_name)
+    # Only the small result dict is cached, never bulk payloads
+    cache.set(cache_key, result, timeout=STEP_CACHE_TTL)
+    return result
+
+
+@StepRegistry.register('data_fetch')
 def execute_data_fetch(config, step_name):
     """
     Simulate data fetching step.
@@ -219,6 +566,7 @@ def execute_data_fetch(config, step_name):
     }
 
 
+@StepRegistry.register('data_process')
 def execute_data_process(config, step_name):
     """
     Simulate data processing step.
@@ -241,6 +589,7 @@ def execute_data_process(config, step_name):
     }
 
 
+@StepRegistry.register('ai_inference')
 def execute_ai_inference(config, step_name):
     """
     Simulate AI inference step.
@@ -264,6 +613,7 @@ def execute_ai_inference(config, step_name):
     }
 
 
+@StepRegistry.register('notify_user', cacheable=False)
 def execute_notify_user(config, step_name):
     """
     Simulate user notification step.
@@ -285,3 +635,4 @@ def execute_notify_user(config, step_name):
         'message': f"Successfully sent notification via {channel} to {recipient}",
         'channel': channel
     }
+
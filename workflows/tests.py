@@ -5,11 +5,11 @@ from django.test import TestCase
 from django.contrib.auth import get_user_model
 from rest_framework.test import APITestCase, APIClient
 from rest_framework import status
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch
 import json
 
 from workflows.models import Workflow, WorkflowExecution, ExecutionLog
-from workflows.tasks import execute_workflow_task, execute_step
+from workflows.tasks import execute_workflow_task, execute_step, _plan_waves
 
 User = get_user_model()
 
@@ -192,30 +192,144 @@ class WorkflowAPITests(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(len(response.data['results']), 0)
     
-    @patch('workflows.views.execute_workflow_task.delay')
+    @patch('workflows.views.execute_workflow_task.apply_async')
     def test_start_workflow_execution(self, mock_task):
         """Test starting a workflow execution."""
-        # Mock Celery task
-        mock_task.return_value = MagicMock(id='test-task-id')
-        
         workflow = Workflow.objects.create(
             user=self.user,
             name='Test Workflow',
             steps=self.workflow_data['steps']
         )
         
-        response = self.client.post(f'/api/workflows/{workflow.id}/start/')
-        
+        # The dispatch rides transaction.on_commit, so execute the
+        # captured callbacks as a real commit would
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(f'/api/workflows/{workflow.id}/start/')
+
         self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
         self.assertIn('execution_id', response.data)
         self.assertIn('task_id', response.data)
         self.assertEqual(response.data['status'], 'CREATED')
         
-        # Verify execution was created
+        # Verify execution was created with the dispatched task id
         execution = WorkflowExecution.objects.get(id=response.data['execution_id'])
         self.assertEqual(execution.workflow, workflow)
         self.assertEqual(execution.status, WorkflowExecution.Status.CREATED)
+        self.assertEqual(execution.task_id, response.data['task_id'])
+        mock_task.assert_called_once_with(
+            args=[str(execution.id)],
+            task_id=execution.task_id
+        )
     
+    @patch('workflows.views.group')
+    def test_batch_start_workflow_executions(self, mock_group):
+        """Test starting executions for several workflows at once."""
+        workflows = [
+            Workflow.objects.create(
+                user=self.user,
+                name=f'Workflow {i}',
+                steps=self.workflow_data['steps']
+            )
+            for i in range(2)
+        ]
+
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(
+                '/api/workflows/batch_start/',
+                data=json.dumps({'workflow_ids': [str(w.id) for w in workflows]}),
+                content_type='application/json'
+            )
+
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+        self.assertEqual(len(response.data['executions']), 2)
+        mock_group.return_value.apply_async.assert_called_once()
+
+        # One CREATED execution per workflow, task ids persisted up front
+        for workflow in workflows:
+            execution = WorkflowExecution.objects.get(workflow=workflow)
+            self.assertEqual(execution.status, WorkflowExecution.Status.CREATED)
+            self.assertIsNotNone(execution.task_id)
+
+    def test_batch_start_rejects_malformed_ids(self):
+        """Test that batch_start 400s on non-UUID entries of any type."""
+        for bad_ids in (['not-a-uuid'], [5], [None]):
+            response = self.client.post(
+                '/api/workflows/batch_start/',
+                data=json.dumps({'workflow_ids': bad_ids}),
+                content_type='application/json'
+            )
+
+            self.assertEqual(
+                response.status_code, status.HTTP_400_BAD_REQUEST, bad_ids
+            )
+        self.assertEqual(WorkflowExecution.objects.count(), 0)
+
+    def test_batch_start_rejects_unknown_workflows(self):
+        """Test that batch_start 404s on workflows the user doesn't own."""
+        other_user = User.objects.create_user(
+            username='otheruser2',
+            email='other2@example.com',
+            password='testpass123'
+        )
+        other_workflow = Workflow.objects.create(
+            user=other_user,
+            name='Other Workflow',
+            steps=self.workflow_data['steps']
+        )
+
+        response = self.client.post(
+            '/api/workflows/batch_start/',
+            data=json.dumps({'workflow_ids': [str(other_workflow.id)]}),
+            content_type='application/json'
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertEqual(WorkflowExecution.objects.count(), 0)
+
+    def test_retrieve_execution_with_logs(self):
+        """Test retrieving an execution detail with its logs."""
+        workflow = Workflow.objects.create(
+            user=self.user,
+            name='Test Workflow',
+            steps=self.workflow_data['steps']
+        )
+        execution = WorkflowExecution.objects.create(
+            workflow=workflow,
+            status=WorkflowExecution.Status.SUCCESS
+        )
+        ExecutionLog.objects.create(
+            execution=execution,
+            step_name='Fetch Data',
+            step_index=0,
+            status=ExecutionLog.Status.SUCCESS,
+            message='done'
+        )
+
+        response = self.client.get(f'/api/workflows/executions/{execution.id}/')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        # The hand-built payload must keep the serializer's shape
+        self.assertEqual(
+            set(response.data.keys()),
+            {
+                'id', 'workflow', 'workflow_name', 'status', 'current_step',
+                'started_at', 'finished_at', 'error_message', 'created_at',
+                'task_id', 'logs'
+            }
+        )
+        self.assertEqual(response.data['workflow_name'], 'Test Workflow')
+        self.assertEqual(len(response.data['logs']), 1)
+        self.assertEqual(response.data['logs'][0]['step_name'], 'Fetch Data')
+
+        # Revalidating with the returned ETag yields a bodyless 304 while
+        # the execution stays in the same state
+        etag = response.headers['ETag']
+        response = self.client.get(
+            f'/api/workflows/executions/{execution.id}/',
+            HTTP_IF_NONE_MATCH=etag
+        )
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
     def test_get_workflow_status(self):
         """Test getting workflow execution status."""
         workflow = Workflow.objects.create(
@@ -236,6 +350,15 @@ class WorkflowAPITests(APITestCase):
         self.assertEqual(response.data['status'], 'RUNNING')
         self.assertEqual(response.data['current_step'], 1)
 
+        # Polling again with the returned ETag yields a bodyless 304
+        # until the execution changes state
+        etag = response.headers['ETag']
+        response = self.client.get(
+            f'/api/workflows/{workflow.id}/status/',
+            HTTP_IF_NONE_MATCH=etag
+        )
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
 
 class WorkflowTaskTests(TestCase):
     """Tests for Celery workflow tasks."""
@@ -304,6 +427,26 @@ class WorkflowTaskTests(TestCase):
         self.assertEqual(logs.count(), 2)
         self.assertTrue(all(log.status == ExecutionLog.Status.SUCCESS for log in logs))
     
+    def test_plan_waves_groups_independent_steps(self):
+        """Test that dependency planning batches independent steps."""
+        steps = [
+            {'name': 'a', 'type': 'data_fetch'},
+            {'name': 'b', 'type': 'data_fetch'},
+            {'name': 'c', 'type': 'data_process', 'depends_on': [0, 1]},
+        ]
+
+        self.assertEqual(_plan_waves(steps), [[0, 1], [2]])
+
+    def test_plan_waves_rejects_cycles(self):
+        """Test that cyclic dependencies are rejected."""
+        steps = [
+            {'name': 'a', 'type': 'data_fetch', 'depends_on': [1]},
+            {'name': 'b', 'type': 'data_fetch', 'depends_on': [0]},
+        ]
+
+        with self.assertRaises(ValueError):
+            _plan_waves(steps)
+
     def test_workflow_execution_idempotency(self):
         """Test that completed executions are not re-executed."""
         execution = WorkflowExecution.objects.create(
@@ -1,13 +1,24 @@
 """
 Views for workflow management and execution.
 """
+import hashlib
+import uuid
+
+import orjson
+from celery import group
 from rest_framework import viewsets, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
-from drf_yasg.utils import swagger_auto_schema
-from drf_yasg import openapi
+from django.conf import settings
+from django.core.cache import cache
+from django.core.exceptions import ValidationError
+from django.db import transaction
+from django.http import StreamingHttpResponse
+from django.db.models import Count, F, Prefetch, Q
 from django.shortcuts import get_object_or_404
+from django.utils.decorators import method_decorator
+from django.views.decorators.http import condition
 
 from .models import Workflow, WorkflowExecution, ExecutionLog
 from .serializers import (
@@ -15,10 +26,116 @@ from .serializers import (
     WorkflowListSerializer,
     WorkflowExecutionSerializer,
     WorkflowExecutionListSerializer,
-    ExecutionLogSerializer
+    ExecutionLogSerializer,
+    _render_datetime
 )
 from .permissions import IsWorkflowOwner
-from .tasks import execute_workflow_task
+from .tasks import execute_workflow_task, status_cache_key
+
+# How long a cached latest-status payload may serve polling clients
+STATUS_CACHE_TTL = 2
+
+# drf-yasg is only needed when the docs endpoints are served. Gating the
+# import keeps its schema machinery (and the openapi object graphs below)
+# out of web processes with docs disabled, together with the matching
+# gate on the docs routes in config/urls.py.
+if settings.ENABLE_API_DOCS:
+    from drf_yasg.utils import swagger_auto_schema
+    from drf_yasg import openapi
+
+    # Schema objects for the custom actions, built once at import instead
+    # of inside the decorator call on the view class body.
+    _START_RESPONSE = openapi.Response(
+        description="Workflow execution started",
+        schema=openapi.Schema(
+            type=openapi.TYPE_OBJECT,
+            properties={
+                'execution_id': openapi.Schema(type=openapi.TYPE_STRING),
+                'status': openapi.Schema(type=openapi.TYPE_STRING),
+                'message': openapi.Schema(type=openapi.TYPE_STRING),
+            }
+        )
+    )
+    _BATCH_START_RESPONSE = openapi.Response(
+        description="Workflow executions started",
+        schema=openapi.Schema(
+            type=openapi.TYPE_OBJECT,
+            properties={
+                'executions': openapi.Schema(
+                    type=openapi.TYPE_ARRAY,
+                    items=openapi.Schema(type=openapi.TYPE_OBJECT)
+                ),
+                'message': openapi.Schema(type=openapi.TYPE_STRING),
+            }
+        )
+    )
+else:
+    def swagger_auto_schema(**kwargs):
+        """No-op stand-in when API docs are disabled."""
+        return lambda view: view
+
+    _START_RESPONSE = "Workflow execution started"
+    _BATCH_START_RESPONSE = "Workflow executions started"
+
+
+def _stream_json_array(rows):
+    """
+    Yield a JSON array one encoded row at a time.
+
+    Encoding matches the ORJSONRenderer defaults so streamed and
+    paginated rows look identical on the wire.
+    """
+    yield b'['
+    first = True
+    for row in rows:
+        if first:
+            first = False
+        else:
+            yield b','
+        yield orjson.dumps(row, default=str, option=orjson.OPT_UTC_Z)
+    yield b']'
+
+
+def _latest_execution_etag(request, pk=None):
+    """
+    ETag for a workflow's latest-execution status payload.
+
+    Hashes the columns that change as a run progresses so polling clients
+    sending If-None-Match get a bodyless 304 — no serializer work — until
+    the execution actually moves.
+    """
+    try:
+        row = WorkflowExecution.objects.filter(
+            workflow_id=pk, workflow__user=request.user
+        ).order_by('-created_at').values_list(
+            'id', 'status', 'current_step', 'finished_at'
+        ).first()
+    except (ValueError, ValidationError):
+        return None
+    if row is None:
+        return None
+    return hashlib.md5(repr(row).encode()).hexdigest()
+
+
+def _execution_etag(request, pk=None):
+    """
+    ETag for an execution detail payload.
+
+    Same columns as the status ETag: once an execution reaches a terminal
+    state the tuple stops changing, so clients revalidating the detail
+    page get 304s without the log prefetch or payload build.
+    """
+    try:
+        row = WorkflowExecution.objects.filter(
+            id=pk, workflow__user=request.user
+        ).values_list(
+            'id', 'status', 'current_step', 'finished_at'
+        ).first()
+    except (ValueError, ValidationError):
+        return None
+    if row is None:
+        return None
+    return hashlib.md5(repr(row).encode()).hexdigest()
 
 
 class WorkflowViewSet(viewsets.ModelViewSet):
@@ -31,8 +148,60 @@ class WorkflowViewSet(viewsets.ModelViewSet):
     
     def get_queryset(self):
         """Return workflows for the current user only."""
-        return Workflow.objects.filter(user=self.request.user)
-    
+        # The custom actions never serialize the workflow itself — they only
+        # need the pk and owner for the permission check (plus the name for
+        # the status payload) — so skip the count annotations and leave the
+        # steps JSON in the database.
+        if self.action in ('start', 'status', 'executions'):
+            return Workflow.objects.filter(
+                user=self.request.user
+            ).only('id', 'name', 'user_id', 'latest_execution_id')
+
+        # No select_related('user') / prefetch_related('executions') here on
+        # purpose: the workflow serializers never render the user (it is a
+        # HiddenField) or nested execution objects — executions surface only
+        # as the aggregate counts annotated below — so eager-loading those
+        # relations would add queries without removing any.
+        # The Count annotation makes the query grouped, and Django drops
+        # Meta.ordering for grouped querysets — order explicitly so the
+        # paginated list keeps its newest-first contract.
+        queryset = Workflow.objects.filter(
+            user=self.request.user
+        ).annotate(
+            executions_count=Count('executions')
+        ).order_by('-created_at')
+
+        if self.action == 'list':
+            # The list serializer reads the denormalized steps_count, so the
+            # steps JSON itself never has to leave the database. Per-status
+            # counts ride along in the same aggregation pass via filtered
+            # Count instead of three extra .count() queries per row.
+            queryset = queryset.only(
+                'id', 'name', 'description', 'steps_count',
+                'created_at', 'updated_at'
+            ).annotate(
+                success_count=Count(
+                    'executions',
+                    filter=Q(executions__status=WorkflowExecution.Status.SUCCESS)
+                ),
+                failed_count=Count(
+                    'executions',
+                    filter=Q(executions__status=WorkflowExecution.Status.FAILED)
+                ),
+                running_count=Count(
+                    'executions',
+                    filter=Q(executions__status=WorkflowExecution.Status.RUNNING)
+                ),
+            )
+
+        return queryset
+
+    def get_object(self):
+        """Fetch the workflow once per request, however often it's asked for."""
+        if not hasattr(self, '_cached_object'):
+            self._cached_object = super().get_object()
+        return self._cached_object
+
     def get_serializer_class(self):
         """Use different serializers for list and detail views."""
         if self.action == 'list':
@@ -98,17 +267,7 @@ class WorkflowViewSet(viewsets.ModelViewSet):
         method='post',
         operation_description="Start workflow execution asynchronously",
         responses={
-            202: openapi.Response(
-                description="Workflow execution started",
-                schema=openapi.Schema(
-                    type=openapi.TYPE_OBJECT,
-                    properties={
-                        'execution_id': openapi.Schema(type=openapi.TYPE_STRING),
-                        'status': openapi.Schema(type=openapi.TYPE_STRING),
-                        'message': openapi.Schema(type=openapi.TYPE_STRING),
-                    }
-                )
-            ),
+            202: _START_RESPONSE,
             404: "Not Found"
         }
     )
@@ -119,28 +278,130 @@ class WorkflowViewSet(viewsets.ModelViewSet):
         
         Creates a WorkflowExecution record and dispatches a Celery task.
         """
+        # get_object() reads the workflow with a plain SELECT — never
+        # select_for_update — so concurrent starts of the same workflow
+        # don't serialize behind a row lock just to insert executions.
         workflow = self.get_object()
-        
-        # Create execution record
-        execution = WorkflowExecution.objects.create(
-            workflow=workflow,
-            status=WorkflowExecution.Status.CREATED
-        )
-        
-        # Dispatch Celery task
-        task = execute_workflow_task.delay(str(execution.id))
-        
-        # Update execution with task ID
-        execution.task_id = task.id
-        execution.save(update_fields=['task_id'])
-        
+
+        # Pre-generating the Celery task id lets the execution row carry it
+        # from birth: one INSERT instead of create + post-dispatch UPDATE,
+        # and no window where the worker runs before task_id is persisted
+        task_id = str(uuid.uuid4())
+
+        # The transaction scopes only the INSERT (plus the signal-driven
+        # pointer update), and the publish rides on_commit: the broker
+        # never sees a task whose execution row isn't durably committed,
+        # and no locks are held while talking to the broker.
+        with transaction.atomic():
+            execution = WorkflowExecution.objects.create(
+                workflow=workflow,
+                status=WorkflowExecution.Status.CREATED,
+                task_id=task_id
+            )
+            transaction.on_commit(
+                lambda: execute_workflow_task.apply_async(
+                    args=[str(execution.id)], task_id=task_id
+                )
+            )
+
         return Response({
             'execution_id': str(execution.id),
-            'task_id': task.id,
+            'task_id': task_id,
             'status': execution.status,
             'message': 'Workflow execution started'
         }, status=status.HTTP_202_ACCEPTED)
     
+    @swagger_auto_schema(
+        method='post',
+        operation_description="Start executions for several workflows in one call",
+        responses={
+            202: _BATCH_START_RESPONSE,
+            400: "Bad Request - Validation errors",
+            404: "Not Found"
+        }
+    )
+    @action(detail=False, methods=['post'])
+    def batch_start(self, request):
+        """
+        Start one execution per requested workflow in a single call.
+
+        Per-workflow start() calls pay one INSERT and one broker publish
+        each; this action batches the INSERTs with bulk_create and
+        dispatches the tasks as one Celery group.
+        """
+        workflow_ids = request.data.get('workflow_ids')
+        if not isinstance(workflow_ids, list) or not workflow_ids:
+            return Response({
+                'error': True,
+                'message': 'workflow_ids must be a non-empty list'
+            }, status=status.HTTP_400_BAD_REQUEST)
+
+        # Parse every entry up front so malformed ids of any type (ints,
+        # nulls, garbage strings) get the same 400 — UUIDField would
+        # silently coerce some of them in the query, leaving the
+        # str-conversion below to blow up on the rest.
+        try:
+            parsed_ids = [uuid.UUID(str(wid)) for wid in workflow_ids]
+        except ValueError:
+            return Response({
+                'error': True,
+                'message': 'workflow_ids must contain valid UUIDs'
+            }, status=status.HTTP_400_BAD_REQUEST)
+
+        owned_ids = set(Workflow.objects.filter(
+            user=request.user, id__in=parsed_ids
+        ).values_list('id', flat=True))
+
+        missing = [wid for wid in parsed_ids if wid not in owned_ids]
+        if missing:
+            return Response({
+                'error': True,
+                'message': f"Workflows not found: {', '.join(str(m) for m in missing)}"
+            }, status=status.HTTP_404_NOT_FOUND)
+
+        executions = [
+            WorkflowExecution(
+                workflow_id=wid,
+                status=WorkflowExecution.Status.CREATED,
+                task_id=str(uuid.uuid4())
+            )
+            for wid in owned_ids
+        ]
+        # Same commit-then-publish ordering as start(): the writes commit
+        # as one unit and the group is published only afterwards, without
+        # holding any locks across the broker round-trip.
+        with transaction.atomic():
+            WorkflowExecution.objects.bulk_create(executions)
+
+            # bulk_create bypasses post_save, so maintain the latest-execution
+            # pointers explicitly (each id targets a distinct workflow here)
+            for execution in executions:
+                Workflow.objects.filter(pk=execution.workflow_id).update(
+                    latest_execution=execution
+                )
+
+            transaction.on_commit(
+                lambda: group(
+                    execute_workflow_task.si(
+                        str(execution.id)
+                    ).set(task_id=execution.task_id)
+                    for execution in executions
+                ).apply_async()
+            )
+
+        return Response({
+            'executions': [
+                {
+                    'execution_id': str(execution.id),
+                    'workflow_id': str(execution.workflow_id),
+                    'task_id': execution.task_id,
+                    'status': execution.status,
+                }
+                for execution in executions
+            ],
+            'message': f'{len(executions)} workflow executions started'
+        }, status=status.HTTP_202_ACCEPTED)
+
     @swagger_auto_schema(
         method='get',
         operation_description="Get the latest execution status for a workflow",
@@ -150,22 +411,49 @@ class WorkflowViewSet(viewsets.ModelViewSet):
         }
     )
     @action(detail=True, methods=['get'])
+    @method_decorator(condition(etag_func=_latest_execution_etag))
     def status(self, request, pk=None):
         """
         Get the latest execution status for a workflow.
         """
         workflow = self.get_object()
-        
-        # Get the most recent execution
-        execution = workflow.executions.order_by('-created_at').first()
-        
-        if not execution:
+
+        # Clients poll this endpoint in a loop while a run is in flight, so
+        # a short-TTL cache absorbs most of those hits. The execution tasks
+        # delete the key on every status transition, and the TTL bounds
+        # staleness of current_step between checkpoints.
+        cache_key = status_cache_key(workflow.id)
+        cached = cache.get(cache_key)
+        if cached is not None:
+            return Response(cached)
+
+        # The denormalized pointer turns "latest execution" into a PK
+        # lookup instead of an ORDER BY over the run history; the no-runs
+        # case costs no execution query at all. Logs still ride along in
+        # step order so the serializer's logs field doesn't query
+        # separately.
+        if workflow.latest_execution_id is None:
             return Response({
                 'message': 'No executions found for this workflow'
             }, status=status.HTTP_404_NOT_FOUND)
-        
+
+        execution = WorkflowExecution.objects.prefetch_related(
+            Prefetch(
+                'logs',
+                queryset=ExecutionLog.objects.order_by('step_index', 'timestamp')
+            )
+        ).get(id=workflow.latest_execution_id)
+
+        # The serializer renders workflow_name through the FK; seed the
+        # relation cache with the workflow already in hand instead of
+        # letting that attribute access issue another SELECT. The ORDER BY
+        # above is served by the (workflow, -created_at) index.
+        execution.workflow = workflow
+
         serializer = WorkflowExecutionSerializer(execution)
-        return Response(serializer.data)
+        data = serializer.data
+        cache.set(cache_key, data, timeout=STATUS_CACHE_TTL)
+        return Response(data)
     
     @swagger_auto_schema(
         method='get',
@@ -178,10 +466,35 @@ class WorkflowViewSet(viewsets.ModelViewSet):
         List all executions for a workflow.
         """
         workflow = self.get_object()
-        executions = workflow.executions.order_by('-created_at')
-        
-        serializer = WorkflowExecutionListSerializer(executions, many=True)
-        return Response(serializer.data)
+
+        # values() hands back exactly the dicts the list payload needs —
+        # workflow_name joins in the same query — so rendering skips DRF's
+        # per-row serializer instantiation and per-field getattr walks.
+        # DRF's JSON encoder formats the UUID/datetime values identically
+        # to the serializer fields it replaces.
+        executions = workflow.executions.order_by('-created_at').values(
+            'id', 'workflow', 'status', 'current_step',
+            'started_at', 'finished_at', 'created_at',
+            workflow_name=F('workflow__name')
+        )
+
+        # ?stream=true sidesteps pagination for bulk consumers (exports,
+        # sync jobs): rows are pulled through a server-side cursor and
+        # written out as they arrive, so peak memory stays at chunk size
+        # no matter how long the run history is.
+        if request.query_params.get('stream') in ('true', '1'):
+            return StreamingHttpResponse(
+                _stream_json_array(executions.iterator(chunk_size=500)),
+                content_type='application/json'
+            )
+
+        # Paginate so a workflow with thousands of runs never materializes
+        # (or serializes) its full history in one response
+        page = self.paginate_queryset(executions)
+        if page is not None:
+            return self.get_paginated_response(page)
+
+        return Response(list(executions))
 
 
 class WorkflowExecutionViewSet(viewsets.ReadOnlyModelViewSet):
@@ -195,9 +508,37 @@ class WorkflowExecutionViewSet(viewsets.ReadOnlyModelViewSet):
     
     def get_queryset(self):
         """Return executions for workflows owned by the current user."""
-        return WorkflowExecution.objects.filter(
+        # The joined workflow only feeds workflow_name and the owner check
+        # (which reads user_id straight off the workflow row), so the
+        # steps JSON — easily the widest column in the join — stays in the
+        # database along with every other unused workflow field.
+        queryset = WorkflowExecution.objects.filter(
             workflow__user=self.request.user
-        ).select_related('workflow').prefetch_related('logs')
+        ).select_related('workflow').only(
+            'id', 'workflow__id', 'workflow__name', 'workflow__user_id',
+            'status', 'current_step', 'started_at', 'finished_at',
+            'error_message', 'created_at', 'task_id'
+        )
+
+        if self.action == 'retrieve':
+            # Only the detail payload renders logs
+            queryset = queryset.prefetch_related(
+                Prefetch(
+                    'logs',
+                    queryset=ExecutionLog.objects.only(
+                        'id',
+                        'execution_id',
+                        'step_name',
+                        'step_index',
+                        'status',
+                        'message',
+                        'timestamp',
+                        'duration_seconds'
+                    ).order_by('step_index', 'timestamp')
+                )
+            )
+
+        return queryset
     
     @swagger_auto_schema(
         operation_description="List all workflow executions for the authenticated user",
@@ -205,9 +546,21 @@ class WorkflowExecutionViewSet(viewsets.ReadOnlyModelViewSet):
     )
     def list(self, request, *args, **kwargs):
         """List all executions for the current user's workflows."""
-        queryset = self.get_queryset()
-        serializer = WorkflowExecutionListSerializer(queryset, many=True)
-        return Response(serializer.data)
+        # Same values() fast path as the workflow executions action: the
+        # list payload needs no model instances and no log prefetch
+        queryset = WorkflowExecution.objects.filter(
+            workflow__user=request.user
+        ).order_by('-created_at').values(
+            'id', 'workflow', 'status', 'current_step',
+            'started_at', 'finished_at', 'created_at',
+            workflow_name=F('workflow__name')
+        )
+
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            return self.get_paginated_response(page)
+
+        return Response(list(queryset))
     
     @swagger_auto_schema(
         operation_description="Retrieve a specific workflow execution with logs",
@@ -216,6 +569,26 @@ class WorkflowExecutionViewSet(viewsets.ReadOnlyModelViewSet):
             404: "Not Found"
         }
     )
+    @method_decorator(condition(etag_func=_execution_etag))
     def retrieve(self, request, *args, **kwargs):
         """Retrieve a specific execution with all logs."""
-        return super().retrieve(request, *args, **kwargs)
+        # get_object() runs the one select_related + log-prefetch query
+        # pair from get_queryset (and the owner check); the payload is
+        # then assembled as plain dicts, mirroring what
+        # WorkflowExecutionSerializer emits without its per-field
+        # to_representation walk. The logs list already takes the bulk
+        # dict path via ExecutionLogListSerializer.
+        execution = self.get_object()
+        return Response({
+            'id': str(execution.id),
+            'workflow': str(execution.workflow_id),
+            'workflow_name': execution.workflow.name,
+            'status': execution.status,
+            'current_step': execution.current_step,
+            'started_at': _render_datetime(execution.started_at),
+            'finished_at': _render_datetime(execution.finished_at),
+            'error_message': execution.error_message,
+            'created_at': _render_datetime(execution.created_at),
+            'task_id': execution.task_id,
+            'logs': ExecutionLogSerializer(execution.logs.all(), many=True).data,
+        })